@@ -79,6 +79,42 @@ def get_all_decks():
             conn.close()
     return decks
 
+# SQLite caps compound SELECTs at 500 terms by default, so the per-deck counts
+# are UNIONed together in chunks that stay safely below that limit.
+COUNT_QUERY_CHUNK_SIZE = 400
+
+def get_deck_card_counts():
+    """Retrieve a dict mapping every deck name to the number of cards in it.
+
+    Decks whose cards could not be counted map to None instead of being left out.
+    """
+    conn = create_connection()
+    counts = {}
+    if conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND substr(name, 1, 7) != 'sqlite_';")
+            deck_names = [row[0] for row in cursor.fetchall()]
+            counts = dict.fromkeys(deck_names)
+
+            for start in range(0, len(deck_names), COUNT_QUERY_CHUNK_SIZE):
+                chunk = deck_names[start:start + COUNT_QUERY_CHUNK_SIZE]
+                selects = []
+                for deck_name in chunk:
+                    table_name_safe = ''.join(c for c in deck_name if c.isalnum() or c == '_')
+                    selects.append(f"SELECT ?, COUNT(*) FROM {table_name_safe}")
+                try:
+                    cursor.execute(" UNION ALL ".join(selects) + ";", chunk)
+                    counts.update(cursor.fetchall())
+                except sqlite3.Error as e:
+                    # Keep the decks in this chunk listed with an unknown count
+                    print(f"Error counting cards in decks {chunk[0]} to {chunk[-1]}: {e}")
+        except sqlite3.Error as e:
+            print(f"Error counting cards in decks: {e}")
+        finally:
+            conn.close()
+    return counts
+
 def get_cards_from_deck(deck_name):
     """Retrieve all flashcards from a specified deck, including their IDs."""
     conn = create_connection()
@@ -1,7 +1,11 @@
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, simpledialog
 import random
+import bisect
+import threading
+import time
 import database as db
+import maintenance
 
 class FlashcardApp:
     def __init__(self, master):
@@ -15,6 +19,18 @@ class FlashcardApp:
         self.current_card_index = -1
         self.practice_mode = tk.StringVar(value="japanese_to_english")
         self.selected_test_decks = []
+        self.test_deck_names = []
+        self.selected_test_decks_set = set()
+        self._test_filter_job = None
+
+        # Look-ahead pipeline that prepares upcoming cards while the current one is shown
+        self.prefetch_depth = 3
+        self.prepared_cards = {}
+        self.prefetch_generation = 0
+        self.prefetch_in_flight = False
+        self.prefetch_hits = 0
+        self.prefetch_misses = 0
+        self.japanese_display_label = None
 
         # Define modern fonts and colors
         self.font_large = ("Segoe UI", 24, "bold")
@@ -33,11 +49,84 @@ class FlashcardApp:
         self.color_card_front = "#BBDEFB" # Light blue for card front
         self.color_card_back = "#E0E0E0"  # Grey for card back
 
+        # Idle-time database maintenance (all intervals in seconds)
+        self.idle_check_interval_ms = 30000
+        self.idle_threshold = 60
+        self.idle_maintenance_interval = 600
+        self.snapshot_interval = 3600
+        self.start_time = time.monotonic()
+        self.last_activity_time = self.start_time
+        self.last_idle_maintenance_time = self.start_time
+        self.last_snapshot_time = None
+        self.maintenance_running = False
+        master.bind_all("<Key>", self._note_user_activity, add="+")
+        master.bind_all("<Button>", self._note_user_activity, add="+")
+        master.after(self.idle_check_interval_ms, self._check_idle_maintenance)
 
         self.create_main_menu()
 
+    def _note_user_activity(self, event=None):
+        """Records the time of the latest key press or click."""
+        self.last_activity_time = time.monotonic()
+
+    def _run_in_background(self, task, on_done=None):
+        """Runs task on a worker thread and passes its result to on_done on the Tk thread."""
+        result = {}
+
+        def worker():
+            result["value"] = task()
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+
+        def poll():
+            if thread.is_alive():
+                self.master.after(100, poll)
+            elif on_done:
+                on_done(result.get("value"))
+
+        self.master.after(100, poll)
+
+    def _check_idle_maintenance(self):
+        """Periodically snapshots and tidies the database while the user is idle.
+
+        Both only run if the user has done something since they last ran, so an
+        app left open does not rotate old snapshots out with identical copies.
+        """
+        now = time.monotonic()
+        idle = now - self.last_activity_time >= self.idle_threshold
+        if idle and not self.maintenance_running:
+            last_snapshot_time = self.start_time if self.last_snapshot_time is None else self.last_snapshot_time
+            take_snapshot = (self.last_activity_time > last_snapshot_time
+                             and (self.last_snapshot_time is None or now - self.last_snapshot_time >= self.snapshot_interval))
+            run_maintenance = (self.last_activity_time > self.last_idle_maintenance_time
+                               and now - self.last_idle_maintenance_time >= self.idle_maintenance_interval)
+            if take_snapshot or run_maintenance:
+                self.maintenance_running = True
+
+                def task():
+                    if take_snapshot:
+                        maintenance.create_snapshot()
+                    if run_maintenance:
+                        maintenance.run_idle_maintenance()
+
+                def done(_result):
+                    # Use the start time so activity during the run counts towards the next one
+                    self.maintenance_running = False
+                    if take_snapshot:
+                        self.last_snapshot_time = now
+                    if run_maintenance:
+                        self.last_idle_maintenance_time = now
+
+                self._run_in_background(task, done)
+        self.master.after(self.idle_check_interval_ms, self._check_idle_maintenance)
+
     def clear_frame(self):
         """Clears all widgets from the current frame."""
+        # A pending deck filter would otherwise fire on the destroyed picker
+        if self._test_filter_job is not None:
+            self.master.after_cancel(self._test_filter_job)
+            self._test_filter_job = None
         for widget in self.master.winfo_children():
             widget.destroy()
 
@@ -88,6 +177,7 @@ class FlashcardApp:
         tk.Radiobutton(practice_mode_frame, text="Mixed (Random)", variable=self.practice_mode, value="mixed", font=self.font_medium, bg=self.color_background, fg=self.color_text_dark, selectcolor=self.color_background).pack(side=tk.LEFT, padx=20)
 
         tk.Button(self.master, text="Start Test Mode (Multiple Decks)", command=self.start_test_mode_selection, font=self.font_medium, bg="#9C27B0", fg=self.color_text_light, padx=20, pady=10).pack(pady=15)
+        tk.Button(self.master, text="Database Maintenance", command=self.open_maintenance_window, font=self.font_small, bg="#607D8B", fg=self.color_text_light, padx=15, pady=5).pack(pady=5)
 
 
     def populate_deck_listbox(self):
@@ -295,50 +385,145 @@ class FlashcardApp:
 
 
     def start_test_mode_selection(self):
-        """Displays a window to select multiple decks for test mode."""
+        """Displays a filterable deck picker to select multiple decks for test mode."""
         self.clear_frame()
         self.master.config(bg=self.color_background)
 
         tk.Label(self.master, text="Select Decks for Test Mode", font=self.font_large, bg=self.color_background, fg=self.color_text_dark).pack(pady=20)
 
-        all_decks = db.get_all_decks()
-        if not all_decks:
+        # One aggregate query provides both the deck list and the card counts
+        self.test_deck_card_counts = db.get_deck_card_counts()
+        if not self.test_deck_card_counts:
             tk.Label(self.master, text="No decks available. Please create some first.", font=self.font_medium, bg=self.color_background, fg=self.color_text_dark).pack(pady=10)
             tk.Button(self.master, text="Back to Main Menu", command=self.create_main_menu, font=self.font_medium, bg="#607D8B", fg=self.color_text_light, padx=20, pady=10).pack(pady=20)
             return
 
-        checkbox_container = tk.Frame(self.master, bg=self.color_background)
-        checkbox_container.pack(pady=10, padx=50, fill="both", expand=True)
+        # Keep names sorted case-insensitively so prefix filtering can use a binary search
+        self.test_deck_names = sorted(self.test_deck_card_counts, key=str.lower)
+        self.test_deck_keys = [name.lower() for name in self.test_deck_names]
+        self.selected_test_decks_set = set(self.selected_test_decks) & set(self.test_deck_names)
+        self.filtered_test_decks = []
+        self._shown_test_filter = None
+
+        filter_frame = tk.Frame(self.master, bg=self.color_background)
+        filter_frame.pack(pady=5, padx=50, fill="x")
+        tk.Label(filter_frame, text="Filter:", font=self.font_medium, bg=self.color_background, fg=self.color_text_dark).pack(side=tk.LEFT, padx=5)
+        self.test_filter_var = tk.StringVar()
+        filter_entry = tk.Entry(filter_frame, textvariable=self.test_filter_var, width=30, font=self.font_medium, bd=2, relief="solid")
+        filter_entry.pack(side=tk.LEFT, padx=5, fill="x", expand=True)
+        self.test_match_mode = tk.StringVar(value="prefix")
+        tk.Radiobutton(filter_frame, text="Starts with", variable=self.test_match_mode, value="prefix", command=self.apply_test_deck_filter, font=self.font_small, bg=self.color_background, fg=self.color_text_dark, selectcolor=self.color_background).pack(side=tk.LEFT, padx=5)
+        tk.Radiobutton(filter_frame, text="Contains", variable=self.test_match_mode, value="substring", command=self.apply_test_deck_filter, font=self.font_small, bg=self.color_background, fg=self.color_text_dark, selectcolor=self.color_background).pack(side=tk.LEFT, padx=5)
+        self.test_filter_var.trace_add("write", lambda *args: self._schedule_test_deck_filter())
+
+        # A single Listbox only draws the rows currently in view, unlike one Checkbutton per deck
+        listbox_frame = tk.Frame(self.master, bg=self.color_background)
+        listbox_frame.pack(pady=10, padx=50, fill="both", expand=True)
 
-        canvas = tk.Canvas(checkbox_container, bg=self.color_background, bd=0, highlightthickness=0)
-        canvas.pack(side=tk.LEFT, fill="both", expand=True)
+        self.test_deck_listbox = tk.Listbox(listbox_frame, selectmode=tk.MULTIPLE, exportselection=False, height=12, font=self.font_medium, bd=2, relief="groove",
+                                            selectbackground=self.color_secondary, selectforeground=self.color_text_light)
+        self.test_deck_listbox.pack(side=tk.LEFT, fill="both", expand=True, padx=5, pady=5)
+        self.test_deck_listbox.bind("<<ListboxSelect>>", self._on_test_deck_select)
 
-        scrollbar = tk.Scrollbar(checkbox_container, orient="vertical", command=canvas.yview)
+        scrollbar = tk.Scrollbar(listbox_frame, orient="vertical", command=self.test_deck_listbox.yview)
         scrollbar.pack(side=tk.RIGHT, fill="y")
+        self.test_deck_listbox.config(yscrollcommand=scrollbar.set)
 
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion = canvas.bbox("all")))
-
-        self.deck_checkbox_frame = tk.Frame(canvas, bg=self.color_background)
-        canvas.create_window((0, 0), window=self.deck_checkbox_frame, anchor="nw")
-
-        self.deck_checkboxes = {}
-        self.selected_test_decks_vars = []
+        selection_frame = tk.Frame(self.master, bg=self.color_background)
+        selection_frame.pack(pady=5)
+        tk.Button(selection_frame, text="Select All Shown", command=self.select_all_filtered_test_decks, font=self.font_small, bg=self.color_secondary, fg=self.color_text_light, padx=10, pady=4).pack(side=tk.LEFT, padx=5)
+        tk.Button(selection_frame, text="Clear Shown", command=self.clear_filtered_test_decks, font=self.font_small, bg="#607D8B", fg=self.color_text_light, padx=10, pady=4).pack(side=tk.LEFT, padx=5)
+        self.test_selection_label = tk.Label(selection_frame, text="", font=self.font_small, bg=self.color_background, fg=self.color_text_dark)
+        self.test_selection_label.pack(side=tk.LEFT, padx=10)
 
-        for deck_name in all_decks:
-            var = tk.BooleanVar(value=False)
-            cb = tk.Checkbutton(self.deck_checkbox_frame, text=deck_name, variable=var, font=self.font_medium, bg=self.color_background, fg=self.color_text_dark, selectcolor=self.color_background)
-            cb.pack(anchor="w", padx=10, pady=5)
-            self.deck_checkboxes[deck_name] = var
-            self.selected_test_decks_vars.append((deck_name, var))
+        self.apply_test_deck_filter()
+        filter_entry.focus_set()
 
         tk.Button(self.master, text="Start Test", command=self.start_test_practice, font=self.font_medium, bg=self.color_primary, fg=self.color_text_light, padx=20, pady=10).pack(pady=15)
         tk.Button(self.master, text="Back to Main Menu", command=self.create_main_menu, font=self.font_medium, bg="#607D8B", fg=self.color_text_light, padx=20, pady=10).pack(pady=10)
 
+    def _schedule_test_deck_filter(self):
+        """Debounces filter keystrokes so fast typing only refilters once."""
+        if self._test_filter_job is not None:
+            self.master.after_cancel(self._test_filter_job)
+        self._test_filter_job = self.master.after(150, self.apply_test_deck_filter)
+
+    def _filter_test_deck_names(self, query):
+        """Returns the deck names matching the query for the current match mode."""
+        query = query.strip().lower()
+        if not query:
+            return self.test_deck_names
+        if self.test_match_mode.get() == "prefix":
+            lo = bisect.bisect_left(self.test_deck_keys, query)
+            # chr(0x10FFFF) sorts after every character, including supplementary-plane kanji
+            hi = bisect.bisect_left(self.test_deck_keys, query + chr(0x10FFFF), lo)
+            return self.test_deck_names[lo:hi]
+        return [name for name, key in zip(self.test_deck_names, self.test_deck_keys) if query in key]
+
+    def apply_test_deck_filter(self):
+        """Refills the test deck listbox with the decks matching the filter text."""
+        self._test_filter_job = None
+        if not self.test_deck_listbox.winfo_exists():
+            return
+
+        query = self.test_filter_var.get().strip().lower()
+        # Every match mode shows all decks for an empty query
+        shown_filter = (query, self.test_match_mode.get() if query else None)
+        if shown_filter == self._shown_test_filter:
+            return
+        self._shown_test_filter = shown_filter
+        self.filtered_test_decks = self._filter_test_deck_names(query)
+
+        self.test_deck_listbox.delete(0, tk.END)
+        if self.filtered_test_decks:
+            counts = self.test_deck_card_counts
+            self.test_deck_listbox.insert(tk.END, *(f"{name}  ({'?' if counts[name] is None else counts[name]} cards)" for name in self.filtered_test_decks))
+            self._restore_test_deck_selection()
+        self._update_test_selection_label()
+
+    def _restore_test_deck_selection(self):
+        """Reselects the shown decks that are in the overall selection, one call per contiguous run."""
+        selected = self.selected_test_decks_set
+        run_start = None
+        for index, name in enumerate(self.filtered_test_decks):
+            if name in selected:
+                if run_start is None:
+                    run_start = index
+            elif run_start is not None:
+                self.test_deck_listbox.selection_set(run_start, index - 1)
+                run_start = None
+        if run_start is not None:
+            self.test_deck_listbox.selection_set(run_start, tk.END)
+
+    def _on_test_deck_select(self, event=None):
+        """Syncs the listbox selection for the shown decks into the overall selection."""
+        selected_indices = set(self.test_deck_listbox.curselection())
+        for index, name in enumerate(self.filtered_test_decks):
+            if index in selected_indices:
+                self.selected_test_decks_set.add(name)
+            else:
+                self.selected_test_decks_set.discard(name)
+        self._update_test_selection_label()
+
+    def select_all_filtered_test_decks(self):
+        """Selects every deck currently shown by the filter."""
+        self.selected_test_decks_set.update(self.filtered_test_decks)
+        self.test_deck_listbox.selection_set(0, tk.END)
+        self._update_test_selection_label()
+
+    def clear_filtered_test_decks(self):
+        """Deselects every deck currently shown by the filter."""
+        self.selected_test_decks_set.difference_update(self.filtered_test_decks)
+        self.test_deck_listbox.selection_clear(0, tk.END)
+        self._update_test_selection_label()
+
+    def _update_test_selection_label(self):
+        """Shows how many decks are shown and selected."""
+        self.test_selection_label.config(text=f"Showing {len(self.filtered_test_decks)} of {len(self.test_deck_names)} decks, {len(self.selected_test_decks_set)} selected")
 
     def start_test_practice(self):
         """Initiates the practice session with selected multiple decks."""
-        self.selected_test_decks = [deck_name for deck_name, var in self.selected_test_decks_vars if var.get()]
+        self.selected_test_decks = [deck_name for deck_name in self.test_deck_names if deck_name in self.selected_test_decks_set]
 
         if not self.selected_test_decks:
             messagebox.showwarning("No Decks Selected", "Please select at least one deck to start the test.")
@@ -376,45 +561,114 @@ class FlashcardApp:
         self.current_card_index = -1
         self.correct_count = 0
         self.total_tested = 0
+        self._reset_prefetch()
 
 
     def _begin_practice_session(self):
         """Common method to start the practice session after cards are loaded."""
+        self._build_practice_screen()
         self.show_next_card()
 
 
-    def show_next_card(self):
-        """Displays the next flashcard for practice."""
-        self.current_card_index += 1
-        if self.current_card_index >= len(self.flashcards):
-            self.end_practice_session()
+    def _reset_prefetch(self):
+        """Drops all prepared cards and zeroes the hit/miss counters for a new session."""
+        # Results of a fetch still running for the previous session are discarded
+        self.prefetch_generation += 1
+        self.prefetch_in_flight = False
+        self.prepared_cards = {}
+        self.prefetch_hits = 0
+        self.prefetch_misses = 0
+
+    @staticmethod
+    def _fetch_card_data(card_data):
+        """Loads the text of a card; runs on a worker thread, so it must not touch Tk."""
+        return {
+            "question": card_data["question"],
+            "answer": card_data["answer"],
+            "normalized_answer": card_data["answer"].strip().lower(),
+            "type": card_data["type"],
+        }
+
+    def _resolve_card_display(self, fetched):
+        """Adds the Tk-facing prompt and font to fetched card data, on the Tk thread."""
+        if fetched["type"] == "jp_to_en":
+            fetched["prompt"] = "Translate Japanese to English:"
+            fetched["font"] = self.font_card_japanese
+        else:
+            fetched["prompt"] = "Translate English to Japanese:"
+            fetched["font"] = self.font_card_english
+        return fetched
+
+    def _prepare_card(self, index):
+        """Resolves everything needed to display and check the card at index."""
+        return self._resolve_card_display(self._fetch_card_data(self.flashcards[index]))
+
+    def _get_prepared_card(self, index):
+        """Returns the prepared card at index, preparing it now if the look-ahead missed it."""
+        prepared = self.prepared_cards.pop(index, None)
+        if prepared is not None:
+            self.prefetch_hits += 1
+            return prepared
+        self.prefetch_misses += 1
+        return self._prepare_card(index)
+
+    def _schedule_prefetch(self):
+        """Fetches the cards following the current one, up to prefetch_depth ahead, on a worker thread."""
+        if self.prefetch_in_flight:
+            return
+        last_index = min(self.current_card_index + self.prefetch_depth, len(self.flashcards) - 1)
+        pending = [(index, self.flashcards[index]) for index in range(self.current_card_index + 1, last_index + 1)
+                   if index not in self.prepared_cards]
+        if not pending:
             return
 
+        self.prefetch_in_flight = True
+        generation = self.prefetch_generation
+
+        def fetch():
+            return [(index, self._fetch_card_data(card_data)) for index, card_data in pending]
+
+        def done(fetched_cards):
+            if generation != self.prefetch_generation:
+                return
+            self.prefetch_in_flight = False
+            for index, fetched in fetched_cards or []:
+                # Cards already shown while the fetch ran were counted as misses
+                if index > self.current_card_index and index not in self.prepared_cards:
+                    self.prepared_cards[index] = self._resolve_card_display(fetched)
+            # Top up in case the user moved on while the fetch was running
+            self._schedule_prefetch()
+
+        self._run_in_background(fetch, done)
+
+    def get_prefetch_stats(self):
+        """Returns the look-ahead hit/miss counters for the current practice session."""
+        lookups = self.prefetch_hits + self.prefetch_misses
+        return {
+            "hits": self.prefetch_hits,
+            "misses": self.prefetch_misses,
+            "hit_rate": self.prefetch_hits / lookups if lookups else 0.0,
+        }
+
+    def _build_practice_screen(self):
+        """Builds the practice widgets once per session; show_next_card only updates them."""
         self.clear_frame()
         self.master.config(bg=self.color_background)
-        self.master.bind("<Return>", lambda event: self.check_answer())
-
-        card_data = self.flashcards[self.current_card_index]
-        question_text = card_data["question"]
-        card_type = card_data["type"]
 
         display_deck_name = self.current_deck
         if len(self.selected_test_decks) > 0 and self.current_deck == ", ".join(self.selected_test_decks):
             display_deck_name = "Multi-Deck Test"
 
         tk.Label(self.master, text=f"Practicing: {display_deck_name}", font=self.font_medium, bg=self.color_background, fg=self.color_text_dark).pack(pady=10)
-        tk.Label(self.master, text=f"Card {self.current_card_index + 1} of {len(self.flashcards)}", font=self.font_small, bg=self.color_background, fg=self.color_text_dark).pack(pady=5)
+        self.card_counter_label = tk.Label(self.master, text="", font=self.font_small, bg=self.color_background, fg=self.color_text_dark)
+        self.card_counter_label.pack(pady=5)
 
         card_frame = tk.Frame(self.master, bg=self.color_card_front, bd=5, relief="raised")
         card_frame.pack(pady=30, padx=50, fill="both", expand=True)
 
-        if card_type == "jp_to_en":
-            tk.Label(card_frame, text="Translate Japanese to English:", font=self.font_medium, bg=self.color_card_front, fg=self.color_text_dark).pack(pady=10)
-            self.japanese_display_label = tk.Label(card_frame, text=question_text, font=self.font_card_japanese, bg=self.color_card_front, fg="blue")
-        else:
-            tk.Label(card_frame, text="Translate English to Japanese:", font=self.font_medium, bg=self.color_card_front, fg=self.color_text_dark).pack(pady=10)
-            self.japanese_display_label = tk.Label(card_frame, text=question_text, font=self.font_card_english, bg=self.color_card_front, fg="blue")
-        
+        self.card_prompt_label = tk.Label(card_frame, text="", font=self.font_medium, bg=self.color_card_front, fg=self.color_text_dark)
+        self.card_prompt_label.pack(pady=10)
+        self.japanese_display_label = tk.Label(card_frame, text="", bg=self.color_card_front, fg="blue")
         self.japanese_display_label.pack(pady=30)
 
         tk.Label(self.master, text="Your Answer:", font=self.font_medium, bg=self.color_background, fg=self.color_text_dark).pack(pady=10)
@@ -439,19 +693,46 @@ class FlashcardApp:
 
         self.back_to_main_menu_button = tk.Button(self.master, text="Back to Main Menu", command=self.create_main_menu, font=self.font_medium, bg="#607D8B", fg=self.color_text_light, padx=20, pady=10)
         self.back_to_main_menu_button.pack(pady=20)
+
+    def show_next_card(self):
+        """Displays the next flashcard for practice."""
+        self.current_card_index += 1
+        if self.current_card_index >= len(self.flashcards):
+            self.end_practice_session()
+            return
+
+        if self.japanese_display_label is None or not self.japanese_display_label.winfo_exists():
+            self._build_practice_screen()
+
+        self.current_prepared_card = self._get_prepared_card(self.current_card_index)
+        card = self.current_prepared_card
+
+        # Swap the prepared card into the existing widgets instead of rebuilding them
+        self.card_counter_label.config(text=f"Card {self.current_card_index + 1} of {len(self.flashcards)}")
+        self.card_prompt_label.config(text=card["prompt"])
+        self.japanese_display_label.config(text=card["question"], font=card["font"])
+        self.user_answer_entry.config(state=tk.NORMAL)
+        self.user_answer_entry.delete(0, tk.END)
+        self.feedback_label.config(text="")
+        self.submit_button.config(state=tk.NORMAL)
+        self.next_card_button.config(state=tk.DISABLED)
+        self.master.bind("<Return>", lambda event: self.check_answer())
         self.user_answer_entry.focus_set()
 
+        # Prepare the following cards while the user works on this one
+        self._schedule_prefetch()
+
     def check_answer(self):
         """Checks the user's answer against the correct translation."""
         self.total_tested += 1
         user_answer = self.user_answer_entry.get().strip().lower()
-        correct_answer = self.flashcards[self.current_card_index]["answer"].strip().lower()
+        correct_answer = self.current_prepared_card["normalized_answer"]
 
         if user_answer == correct_answer:
             self.feedback_label.config(text="Correct!", fg="green")
             self.correct_count += 1
         else:
-            self.feedback_label.config(text=f"Incorrect. Correct answer was: '{self.flashcards[self.current_card_index]['answer']}'", fg="red")
+            self.feedback_label.config(text=f"Incorrect. Correct answer was: '{self.current_prepared_card['answer']}'", fg="red")
 
         self.user_answer_entry.config(state=tk.DISABLED)
         self.submit_button.config(state=tk.DISABLED)
@@ -465,6 +746,8 @@ class FlashcardApp:
 
         tk.Label(self.master, text="Practice Session Complete!", font=self.font_large, bg=self.color_background, fg=self.color_text_dark).pack(pady=40)
         tk.Label(self.master, text=f"You answered {self.correct_count} out of {self.total_tested} cards correctly.", font=self.font_medium, bg=self.color_background, fg=self.color_text_dark).pack(pady=15)
+        stats = self.get_prefetch_stats()
+        tk.Label(self.master, text=f"Cards ready in advance: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%})", font=self.font_small, bg=self.color_background, fg=self.color_text_dark).pack(pady=5)
         
         button_frame = tk.Frame(self.master, bg=self.color_background)
         button_frame.pack(pady=20)
@@ -518,4 +801,92 @@ class FlashcardApp:
         close_button.pack(pady=15)
 
         all_cards_window.grab_set()
-        self.master.wait_window(all_cards_window)
\ No newline at end of file
+        self.master.wait_window(all_cards_window)
+
+    def open_maintenance_window(self):
+        """Opens a Toplevel window showing database storage and backup/compaction actions."""
+        maintenance_window = tk.Toplevel(self.master)
+        maintenance_window.title("Database Maintenance")
+        maintenance_window.geometry("500x600")
+        maintenance_window.config(bg=self.color_background)
+
+        tk.Label(maintenance_window, text="Database Storage", font=self.font_medium, bg=self.color_background, fg=self.color_text_dark).pack(pady=15)
+
+        report_text_area = scrolledtext.ScrolledText(maintenance_window, width=55, height=15, font=self.font_small, bd=2, relief="groove",
+                                                     bg=self.color_card_back, fg=self.color_text_dark, padx=10, pady=10)
+        report_text_area.pack(pady=10, padx=20, fill="both", expand=True)
+
+        status_label = tk.Label(maintenance_window, text="", font=self.font_small, bg=self.color_background, fg=self.color_text_dark)
+        status_label.pack(pady=5)
+
+        def read_report():
+            return maintenance.get_storage_report(), len(maintenance.list_snapshots())
+
+        def render_report(result):
+            if not maintenance_window.winfo_exists():
+                return
+            report, snapshot_count = result
+            report_text_area.config(state=tk.NORMAL)
+            report_text_area.delete("1.0", tk.END)
+            if not report:
+                report_text_area.insert(tk.END, "Could not read database storage information.")
+            else:
+                report_text_area.insert(tk.END, f"Size: {report['size_bytes'] / 1024:.1f} KB ({report['page_count']} pages of {report['page_size']} bytes)\n")
+                report_text_area.insert(tk.END, f"Free space: {report['free_bytes'] / 1024:.1f} KB ({report['freelist_count']} pages)\n")
+                report_text_area.insert(tk.END, f"Fragmentation: {report['fragmentation']:.1%}\n")
+                if report["incremental_vacuum"]:
+                    report_text_area.insert(tk.END, "Incremental vacuum: enabled (free pages are released while idle)\n")
+                else:
+                    report_text_area.insert(tk.END, "Incremental vacuum: disabled until Compact Now is used once\n")
+                if report["compaction_recommended"]:
+                    report_text_area.insert(tk.END, "Compaction is recommended.\n")
+                report_text_area.insert(tk.END, f"Snapshots kept: {snapshot_count}\n")
+                if report["deck_storage"]:
+                    report_text_area.insert(tk.END, "\nStorage per deck:\n")
+                    for deck_name, size in sorted(report["deck_storage"].items(), key=lambda item: item[1], reverse=True):
+                        report_text_area.insert(tk.END, f"{deck_name}: {size / 1024:.1f} KB\n")
+            report_text_area.config(state=tk.DISABLED)
+
+        def show_report():
+            report_text_area.config(state=tk.NORMAL)
+            report_text_area.delete("1.0", tk.END)
+            report_text_area.insert(tk.END, "Reading database storage...")
+            report_text_area.config(state=tk.DISABLED)
+            self._run_in_background(read_report, render_report)
+
+        def run_action(task, running_text, on_done):
+            if self.maintenance_running:
+                status_label.config(text="Maintenance is already running. Please wait.")
+                return
+            self.maintenance_running = True
+            status_label.config(text=running_text)
+
+            def done(result):
+                self.maintenance_running = False
+                if maintenance_window.winfo_exists():
+                    on_done(result)
+                    show_report()
+
+            self._run_in_background(task, done)
+
+        def backup_done(snapshot_path):
+            if snapshot_path:
+                self.last_snapshot_time = time.monotonic()
+                status_label.config(text=f"Backup saved to {snapshot_path}")
+            else:
+                status_label.config(text="Backup failed.")
+
+        def compact_done(success):
+            status_label.config(text="Database compacted." if success else "Compaction failed.")
+
+        button_frame = tk.Frame(maintenance_window, bg=self.color_background)
+        button_frame.pack(pady=10)
+
+        tk.Button(button_frame, text="Back Up Now", command=lambda: run_action(maintenance.create_snapshot, "Backing up...", backup_done), font=self.font_medium, bg=self.color_primary, fg=self.color_text_light, padx=15, pady=8).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Compact Now", command=lambda: run_action(maintenance.compact_database, "Compacting...", compact_done), font=self.font_medium, bg=self.color_secondary, fg=self.color_text_light, padx=15, pady=8).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Close", command=maintenance_window.destroy, font=self.font_medium, bg="#607D8B", fg=self.color_text_light, padx=15, pady=8).pack(side=tk.LEFT, padx=5)
+
+        show_report()
+
+        maintenance_window.grab_set()
+        self.master.wait_window(maintenance_window)
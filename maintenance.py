@@ -0,0 +1,198 @@
+import os
+import sqlite3
+import datetime
+import database as db
+
+BACKUP_DIR = 'backups'
+SNAPSHOT_PREFIX = 'flashcards_'
+SNAPSHOTS_TO_KEEP = 5
+BACKUP_PAGES_PER_STEP = 64 # Pages copied per backup step before yielding to other connections
+BACKUP_STEP_SLEEP = 0.005
+INCREMENTAL_VACUUM_PAGES = 256 # Free pages returned to the OS per idle maintenance run
+COMPACTION_THRESHOLD = 0.2 # Fraction of free pages above which a full compaction is worthwhile
+
+def create_maintenance_connection():
+    """Create a connection in autocommit mode, which VACUUM requires."""
+    conn = db.create_connection()
+    if conn:
+        conn.isolation_level = None
+    return conn
+
+def backup_database(dest_path, pages=BACKUP_PAGES_PER_STEP, progress=None):
+    """Copy the live database to dest_path using SQLite's online backup API.
+
+    The copy is made in batches of `pages` pages, so the app can keep reading
+    and writing the database while the backup runs.
+    """
+    src = db.create_connection()
+    dest = None
+    if src:
+        try:
+            dest = sqlite3.connect(dest_path)
+            src.backup(dest, pages=pages, progress=progress, sleep=BACKUP_STEP_SLEEP)
+            print(f"Database backed up to '{dest_path}'.")
+            return True
+        except sqlite3.Error as e:
+            print(f"Error backing up database to {dest_path}: {e}")
+            return False
+        finally:
+            if dest:
+                dest.close()
+            src.close()
+    return False
+
+def list_snapshots(backup_dir=BACKUP_DIR):
+    """Return the paths of all snapshots in backup_dir, oldest first."""
+    if not os.path.isdir(backup_dir):
+        return []
+    names = [name for name in os.listdir(backup_dir) if name.startswith(SNAPSHOT_PREFIX) and name.endswith('.db')]
+    # Timestamped names sort chronologically
+    return [os.path.join(backup_dir, name) for name in sorted(names)]
+
+def remove_partial_snapshots(backup_dir=BACKUP_DIR):
+    """Delete snapshot files left unfinished by an interrupted backup."""
+    if not os.path.isdir(backup_dir):
+        return []
+    removed = []
+    for name in os.listdir(backup_dir):
+        if name.startswith(SNAPSHOT_PREFIX) and name.endswith('.db.partial'):
+            path = os.path.join(backup_dir, name)
+            try:
+                os.remove(path)
+                removed.append(path)
+            except OSError as e:
+                print(f"Error removing partial snapshot {path}: {e}")
+    return removed
+
+def rotate_snapshots(backup_dir=BACKUP_DIR, keep=SNAPSHOTS_TO_KEEP):
+    """Delete the oldest snapshots so that at most `keep` remain.
+
+    Also removes partial snapshots left behind if the app closed mid-backup.
+    Only one backup runs at a time, so none of them is still being written.
+    """
+    removed = remove_partial_snapshots(backup_dir)
+    snapshots = list_snapshots(backup_dir)
+    for path in snapshots[:max(len(snapshots) - keep, 0)]:
+        try:
+            os.remove(path)
+            removed.append(path)
+        except OSError as e:
+            print(f"Error removing old snapshot {path}: {e}")
+    return removed
+
+def create_snapshot(backup_dir=BACKUP_DIR, keep=SNAPSHOTS_TO_KEEP, progress=None):
+    """Write a timestamped snapshot of the database and rotate out old ones.
+
+    Returns the snapshot path, or None if the backup failed.
+    """
+    try:
+        os.makedirs(backup_dir, exist_ok=True)
+    except OSError as e:
+        print(f"Error creating backup directory {backup_dir}: {e}")
+        return None
+
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    snapshot_path = os.path.join(backup_dir, f"{SNAPSHOT_PREFIX}{timestamp}.db")
+    # Back up to a temporary file first so a failed backup never looks like a valid snapshot
+    partial_path = snapshot_path + '.partial'
+    if not backup_database(partial_path, progress=progress):
+        try:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        except OSError as e:
+            print(f"Error removing partial snapshot {partial_path}: {e}")
+        return None
+    try:
+        os.replace(partial_path, snapshot_path)
+    except OSError as e:
+        print(f"Error saving snapshot {snapshot_path}: {e}")
+        return None
+    rotate_snapshots(backup_dir, keep)
+    return snapshot_path
+
+def compact_database():
+    """Rebuild the database file, releasing all free pages.
+
+    Also switches the database to incremental auto-vacuum, which only takes
+    effect after a full VACUUM, so later idle runs can keep it compact.
+    """
+    conn = create_maintenance_connection()
+    if conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+            cursor.execute("VACUUM;")
+            print("Database compacted.")
+            return True
+        except sqlite3.Error as e:
+            print(f"Error compacting database: {e}")
+            return False
+        finally:
+            conn.close()
+    return False
+
+def run_idle_maintenance(vacuum_pages=INCREMENTAL_VACUUM_PAGES):
+    """Refresh query planner statistics and release a batch of free pages.
+
+    Meant to run while the app is idle. Free pages are only released once
+    compact_database() has switched the database to incremental auto-vacuum;
+    the full VACUUM it needs holds the write lock, so it is never run here.
+    """
+    conn = create_maintenance_connection()
+    if conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("ANALYZE;")
+            auto_vacuum = cursor.execute("PRAGMA auto_vacuum;").fetchone()[0]
+            if auto_vacuum == 2:
+                # sqlite3 stops a statement that returns no rows after its first step,
+                # which would free a single page; executescript runs it to completion
+                conn.executescript(f"PRAGMA incremental_vacuum({int(vacuum_pages)});")
+            return True
+        except sqlite3.Error as e:
+            print(f"Error running idle maintenance: {e}")
+            return False
+        finally:
+            conn.close()
+    return False
+
+def get_storage_report():
+    """Report the database size, fragmentation and per-deck storage.
+
+    Per-deck storage is read from the dbstat virtual table and is left empty
+    if the SQLite build does not provide it.
+    """
+    conn = db.create_connection()
+    report = {}
+    if conn:
+        try:
+            cursor = conn.cursor()
+            page_size = cursor.execute("PRAGMA page_size;").fetchone()[0]
+            page_count = cursor.execute("PRAGMA page_count;").fetchone()[0]
+            freelist_count = cursor.execute("PRAGMA freelist_count;").fetchone()[0]
+            auto_vacuum = cursor.execute("PRAGMA auto_vacuum;").fetchone()[0]
+            fragmentation = freelist_count / page_count if page_count else 0.0
+
+            deck_storage = {}
+            try:
+                cursor.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name;")
+                deck_storage = {name: size for name, size in cursor.fetchall() if not name.startswith('sqlite_')}
+            except sqlite3.OperationalError:
+                pass
+
+            report = {
+                "size_bytes": page_size * page_count,
+                "free_bytes": page_size * freelist_count,
+                "page_size": page_size,
+                "page_count": page_count,
+                "freelist_count": freelist_count,
+                "fragmentation": fragmentation,
+                "incremental_vacuum": auto_vacuum == 2,
+                "compaction_recommended": fragmentation >= COMPACTION_THRESHOLD,
+                "deck_storage": deck_storage,
+            }
+        except sqlite3.Error as e:
+            print(f"Error building storage report: {e}")
+        finally:
+            conn.close()
+    return report